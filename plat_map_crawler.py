@@ -8,18 +8,41 @@ by following cross-references between maps to discover the complete set of avail
 
 import os
 import re
+import json
 import time
+import atexit
+import asyncio
+import hashlib
 import logging
+import functools
 from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
 from pathlib import Path
-from typing import Set, List
-import requests
+from typing import Any, Dict, Set, List
+import aiohttp
+import aiofiles
+from aiolimiter import AsyncLimiter
 import fitz  # PyMuPDF
 
 # Configuration
 BASE_URL = "https://esmeraldanv.devnetwedge.com/PropertyImages/Platmaps/{}.pdf"
 OUTPUT_DIR = "plat_maps"
-DELAY_SECONDS = 1
+REQUESTS_PER_SECOND = 2  # Sustained request rate to the county server, shared by all communities
+MIN_REQUESTS_PER_SECOND = 0.25  # Floor for the rate after repeated 429/503 responses
+RATE_LIMIT_PAUSE_SECONDS = 30  # How long every request waits after a 429/503
+RATE_RECOVERY_RESPONSES = 5  # Consecutive un-throttled responses before the rate is doubled again
+MAX_CONCURRENT_REQUESTS = 4  # Requests in flight across all communities; also the connection pool size
+KEEPALIVE_SECONDS = 30  # How long idle pooled connections stay open for reuse
+REQUEST_TIMEOUT_SECONDS = 30  # Per connect and per socket read, not for the whole download
+MAX_RETRIES = 3
+RETRY_BACKOFF_SECONDS = 0.5  # Doubled after each retry
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+THROTTLE_STATUSES = {429, 503}  # Server is asking us to slow down
+DOWNLOAD_CHUNK_SIZE = 64 * 1024  # Bytes written per chunk while streaming a PDF to disk
+DISCOVERY_BATCH_SIZE = 10  # Sequential map numbers probed together during systematic discovery
+STATE_FILE = "state.json"  # Per-map crawl state, kept in the output directory
+MISSING_RECHECK_SECONDS = 7 * 24 * 60 * 60  # Trust a recorded 404 for a week before asking again
+REVALIDATE_EXISTING = False  # Re-check existing PDFs with conditional requests instead of skipping them
 
 # Community prefixes known in Esmeralda County
 COMMUNITY_PREFIXES = [
@@ -43,6 +66,22 @@ STARTING_MAPS = [
     "007-01",  # Dyer (changed from 007-65 to 007-01 since we have that example)
 ]
 
+# Map reference patterns, compiled once instead of per page
+# Full-format reference (001-24), applied to the text around a search hit
+_FULL_REF_RE = re.compile(r'\b(0\d{2}-\d{2})\b')
+# Full-format references (001-24) and bare 2-digit numbers (24) in a single pass
+_REF_RE = re.compile(r'\b(?:(?P<full>0\d{2}-\d{2})|(?P<short>\d{2}))\b')
+_SHORT_TOK_RE = re.compile(r'\b\w{1,4}\b')
+
+# Map references are typically small numbers (1-50 range for adjacent maps)
+# Lot numbers are typically larger (100+) or have 3+ digits
+_VALID_TWO_DIGIT = frozenset(f"{n:02d}" for n in range(1, 51))
+
+# TextPage flags: only what reference detection needs. TEXT_PRESERVE_IMAGES is left out so
+# image blocks are never decoded, TEXT_MEDIABOX_CLIP drops text outside the page, and
+# TEXT_DEHYPHENATE is left out because it would join a line-final "001-" onto the next line
+_TEXT_FLAGS = fitz.TEXT_PRESERVE_LIGATURES | fitz.TEXT_PRESERVE_WHITESPACE | fitz.TEXT_MEDIABOX_CLIP
+
 # Set up logging
 logging.basicConfig(
     level=logging.DEBUG,  # Changed to DEBUG for more detailed output
@@ -54,6 +93,78 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Crawl state per map ID, persisted between runs, e.g.
+# {"001-01": {"status": 200, "etag": ..., "last_modified": ..., "sha256": ..., "checked": ...}}
+crawl_state: Dict[str, Dict[str, Any]] = {}
+
+class RequestThrottle:
+    """
+    Host-wide token bucket for requests to the county server.
+    
+    Bursts up to the bucket size are allowed, but the sustained rate stays at rate requests
+    per second. When the server answers 429/503, every request pauses for
+    RATE_LIMIT_PAUSE_SECONDS and the rate is halved. After RATE_RECOVERY_RESPONSES
+    responses in a row without a 429/503, the rate doubles again, up to max_rate.
+    """
+    
+    def __init__(self, rate: float):
+        self.max_rate = rate
+        self.rate = rate
+        self.limiter = self._make_limiter(rate)
+        self._resume = asyncio.Event()
+        self._resume.set()
+        self._last_pause = float("-inf")  # time.monotonic() when the latest pause began
+        self._clean_responses = 0
+    
+    @staticmethod
+    def _make_limiter(rate: float) -> AsyncLimiter:
+        """Build a limiter for rate requests per second whose bucket always holds a whole token."""
+        # AsyncLimiter cannot hand out a token from a bucket smaller than 1, so
+        # rates below 1 request per second lengthen the period instead
+        if rate < 1:
+            return AsyncLimiter(1, 1 / rate)
+        return AsyncLimiter(rate, 1)
+    
+    async def wait(self) -> float:
+        """Wait until a request may be sent; returns the send time to pass to back_off."""
+        await self._resume.wait()
+        await self.limiter.acquire()
+        return time.monotonic()
+    
+    def record_success(self) -> None:
+        """Note a response that was not a 429/503, doubling the rate after enough of them."""
+        if not self._resume.is_set() or self.rate >= self.max_rate:
+            return
+        
+        self._clean_responses += 1
+        if self._clean_responses >= RATE_RECOVERY_RESPONSES:
+            self._clean_responses = 0
+            self.rate = min(self.rate * 2, self.max_rate)
+            self.limiter = self._make_limiter(self.rate)
+            logger.info(f"Server keeping up again; continuing at {self.rate} requests per second")
+    
+    async def back_off(self, sent_at: float) -> None:
+        """
+        Pause all requests and halve the rate.
+        
+        A no-op while a pause is in progress, and for requests sent before the latest pause
+        began, since those were already answered by it.
+        """
+        if not self._resume.is_set() or sent_at < self._last_pause:
+            return
+        
+        self._last_pause = time.monotonic()
+        self._clean_responses = 0
+        self.rate = max(self.rate / 2, MIN_REQUESTS_PER_SECOND)
+        logger.warning(f"Server asked us to slow down; pausing {RATE_LIMIT_PAUSE_SECONDS}s, "
+                       f"then continuing at {self.rate} requests per second")
+        self.limiter = self._make_limiter(self.rate)
+        self._resume.clear()
+        try:
+            await asyncio.sleep(RATE_LIMIT_PAUSE_SECONDS)
+        finally:
+            self._resume.set()
+
 
 def setup_output_directory(output_dir: str) -> Path:
     """Create output directory if it doesn't exist."""
@@ -63,11 +174,132 @@ def setup_output_directory(output_dir: str) -> Path:
     return path
 
 
-def download_pdf(map_id: str, output_path: Path) -> bool:
+def list_existing_pdfs(output_dir: Path) -> Set[str]:
+    """List the PDF filenames already in the output directory with a single scan."""
+    with os.scandir(output_dir) as entries:
+        return {entry.name for entry in entries if entry.name.endswith(".pdf")}
+
+
+def load_crawl_state(output_dir: Path) -> None:
+    """Load the crawl state recorded by a previous run, if any."""
+    state_path = output_dir / STATE_FILE
+    if not state_path.exists():
+        return
+    
+    try:
+        with open(state_path, 'r') as f:
+            crawl_state.update(json.load(f))
+        logger.info(f"Loaded crawl state for {len(crawl_state)} maps from {state_path}")
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable state file {state_path}: {e}")
+
+
+def save_crawl_state(output_dir: Path) -> None:
+    """Write the crawl state so the next run can skip known misses and revalidate downloads."""
+    state_path = output_dir / STATE_FILE
+    tmp_path = state_path.with_suffix(".tmp")
+    
+    try:
+        with open(tmp_path, 'w') as f:
+            json.dump(crawl_state, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, state_path)
+        logger.info(f"Saved crawl state for {len(crawl_state)} maps to {state_path}")
+    except OSError as e:
+        logger.error(f"Failed to save state file {state_path}: {e}")
+
+
+def is_known_missing(map_id: str) -> bool:
+    """Check whether the server recently answered 404 for this map."""
+    entry = crawl_state.get(map_id, {})
+    return entry.get("status") == 404 and time.time() - entry.get("checked", 0) < MISSING_RECHECK_SECONDS
+
+
+def conditional_headers(map_id: str) -> Dict[str, str]:
+    """Build If-None-Match/If-Modified-Since headers from the recorded validators."""
+    entry = crawl_state.get(map_id, {})
+    headers = {}
+    if entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
+    if entry.get("last_modified"):
+        headers["If-Modified-Since"] = entry["last_modified"]
+    return headers
+
+
+def record_response(map_id: str, response: aiohttp.ClientResponse, sha256: str = None) -> None:
+    """
+    Record the outcome of a request for a map in the crawl state.
+    
+    Args:
+        map_id: The map ID (e.g., '001-01')
+        response: Response from the server
+        sha256: Hex digest of the downloaded PDF, if the body was saved
+    """
+    if response.status == 304:
+        crawl_state.setdefault(map_id, {"status": 200})["checked"] = time.time()
+        return
+    
+    if response.status != 200:
+        crawl_state[map_id] = {"status": response.status, "checked": time.time()}
+        return
+    
+    entry = crawl_state.setdefault(map_id, {})
+    entry.update(status=200, checked=time.time())
+    for key, header in (("etag", "ETag"), ("last_modified", "Last-Modified")):
+        if header in response.headers:
+            entry[key] = response.headers[header]
+        else:
+            entry.pop(key, None)
+    if sha256:
+        entry["sha256"] = sha256
+
+
+async def request_with_retries(session: aiohttp.ClientSession, throttle: RequestThrottle, method: str, url: str,
+                               **kwargs) -> aiohttp.ClientResponse:
+    """
+    Issue a request, retrying connection errors and transient HTTP statuses with backoff.
+    
+    Args:
+        session: Shared HTTP session
+        throttle: Rate limiter shared by every request to the server
+        method: HTTP method (e.g., 'GET', 'HEAD')
+        url: URL to request
+        **kwargs: Passed through to session.request
+    
+    Returns:
+        The response; the caller is responsible for releasing it
+    """
+    for attempt in range(MAX_RETRIES + 1):
+        sent_at = await throttle.wait()
+        try:
+            response = await session.request(method, url, **kwargs)
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+            if attempt == MAX_RETRIES:
+                raise
+        else:
+            if response.status not in THROTTLE_STATUSES:
+                throttle.record_success()
+            if response.status not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                return response
+            response.release()
+            
+            if response.status in THROTTLE_STATUSES:
+                await throttle.back_off(sent_at)
+                continue
+        
+        delay = RETRY_BACKOFF_SECONDS * 2 ** attempt
+        logger.debug(f"Retrying {method} {url} in {delay}s (attempt {attempt + 1} of {MAX_RETRIES})")
+        await asyncio.sleep(delay)
+
+
+async def download_pdf_async(session: aiohttp.ClientSession, throttle: RequestThrottle, sem: asyncio.Semaphore,
+                             map_id: str, output_path: Path) -> bool:
     """
     Download a single PDF file.
     
     Args:
+        session: Shared HTTP session
+        throttle: Rate limiter shared by every request to the server
+        sem: Semaphore limiting the number of requests in flight
         map_id: The map ID (e.g., '001-01')
         output_path: Path object for the output directory
     
@@ -76,32 +308,85 @@ def download_pdf(map_id: str, output_path: Path) -> bool:
     """
     url = BASE_URL.format(map_id)
     file_path = output_path / f"{map_id}.pdf"
+    part_path = file_path.with_suffix(".pdf.part")
     
-    # Skip if file already exists
+    # Skip if file already exists, unless asked to revalidate it against the server
+    headers = {}
     if file_path.exists():
-        logger.info(f"Skipping {map_id} - already exists")
-        return True
+        if not REVALIDATE_EXISTING:
+            logger.info(f"Skipping {map_id} - already exists")
+            return True
+        headers = conditional_headers(map_id)
+    
+    # Skip maps the server recently reported as missing
+    if is_known_missing(map_id):
+        logger.info(f"Skipping {map_id} - not found on a previous run")
+        return False
     
     try:
         logger.info(f"Downloading {map_id} from {url}")
-        response = requests.get(url, timeout=30)
-        response.raise_for_status()
-        
-        with open(file_path, 'wb') as f:
-            f.write(response.content)
+        async with sem, await request_with_retries(session, throttle, "GET", url, headers=headers) as response:
+            if response.status == 304:
+                record_response(map_id, response)
+                logger.info(f"Skipping {map_id} - unchanged on server")
+                return True
+            if response.status == 404:
+                record_response(map_id, response)
+            response.raise_for_status()
+            
+            # Stream to a temporary file so a partial download never looks like a finished map
+            digest = hashlib.sha256()
+            async with aiofiles.open(part_path, 'wb') as f:
+                async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                    digest.update(chunk)
+                    await f.write(chunk)
+            record_response(map_id, response, digest.hexdigest())
         
+        os.replace(part_path, file_path)
         logger.info(f"Successfully downloaded {map_id}")
         return True
         
-    except requests.exceptions.RequestException as e:
+    except (aiohttp.ClientError, asyncio.TimeoutError, OSError) as e:
         logger.error(f"Failed to download {map_id}: {e}")
+        part_path.unlink(missing_ok=True)
+        return False
+
+
+async def probe_exists_async(session: aiohttp.ClientSession, throttle: RequestThrottle, sem: asyncio.Semaphore,
+                             map_id: str) -> bool:
+    """
+    Check whether a map exists on the server without downloading it.
+    
+    Args:
+        session: Shared HTTP session
+        throttle: Rate limiter shared by every request to the server
+        sem: Semaphore limiting the number of requests in flight
+        map_id: The map ID (e.g., '001-01')
+    
+    Returns:
+        True if the server has the map, False otherwise
+    """
+    url = BASE_URL.format(map_id)
+    
+    if is_known_missing(map_id):
+        logger.debug(f"Skipping probe for {map_id} - not found on a previous run")
+        return False
+    
+    try:
+        async with sem, await request_with_retries(session, throttle, "HEAD", url,
+                                                   headers=conditional_headers(map_id),
+                                                   allow_redirects=True) as response:
+            if response.status in (200, 304, 404):
+                record_response(map_id, response)
+            return response.status in (200, 304)
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        logger.debug(f"Probe failed for {map_id}: {e}")
         return False
 
 
 def extract_map_references(pdf_path: Path) -> List[str]:
     """
     Extract circled map reference numbers from a PDF.
-    Uses multiple extraction methods to find references.
     
     Args:
         pdf_path: Path to the PDF file
@@ -109,131 +394,142 @@ def extract_map_references(pdf_path: Path) -> List[str]:
     Returns:
         List of map IDs found in the PDF
     """
-    references = []
+    references: Set[str] = set()
+    current_map = pdf_path.stem  # Get filename without extension
+    community_prefix = current_map.split("-")[0]
     
     try:
-        doc = fitz.open(pdf_path)
-        
-        for page_num in range(len(doc)):
-            page = doc.load_page(page_num)
-            
-            # Method 1: Extract all text (including text in different layers)
-            text_dict = page.get_text("dict")
-            all_text_content = []
-            
-            def extract_text_from_dict(obj):
-                """Recursively extract text from PDF dictionary structure."""
-                if isinstance(obj, dict):
-                    if "spans" in obj:
-                        for span in obj["spans"]:
-                            if "text" in span:
-                                all_text_content.append(span["text"])
-                    for key, value in obj.items():
-                        if key in ["blocks", "lines", "spans"]:
-                            if isinstance(value, list):
-                                for item in value:
-                                    extract_text_from_dict(item)
-                elif isinstance(obj, list):
-                    for item in obj:
-                        extract_text_from_dict(item)
-            
-            extract_text_from_dict(text_dict)
-            combined_text = " ".join(all_text_content)
-            
-            # Method 2: Also get regular text extraction
-            regular_text = page.get_text()
-            full_text = combined_text + " " + regular_text
-            
-            logger.debug(f"Extracted text from {pdf_path.name}, page {page_num}: {repr(full_text[:500])}")
-            
-            # Also log all unique short text pieces for debugging
-            short_texts = re.findall(r'\b\w{1,4}\b', full_text)
-            unique_short = sorted(set(short_texts))
-            logger.debug(f"All short text pieces (1-4 chars): {unique_short}")
-            
-            # Look for potential map reference patterns
-            # Based on visual inspection, we expect 2-digit numbers like 02, 03, 04
-            
-            # First, look for full format references
-            full_format_matches = re.findall(r'\b(0\d{2}-\d{2})\b', full_text)
-            for match in full_format_matches:
-                references.append(match)
-            
-            # Then look for 2-digit numbers that could be map references
-            # We need to be careful to distinguish between map references and lot numbers
-            two_digit_matches = re.findall(r'\b(\d{2})\b', full_text)
-            
-            found_numbers = set()
-            for match in two_digit_matches:
-                num = int(match)
-                # Map references are typically small numbers (1-50 range for adjacent maps)
-                # Lot numbers are typically larger (100+) or have 3+ digits
-                if 1 <= num <= 50:  # Narrower range for likely map references
-                    found_numbers.add(num)
-                    logger.debug(f"Found potential map reference: {match}")
-            
-            # Convert found numbers to proper format
-            for num in found_numbers:
-                formatted_id = f"001-{num:02d}"
-                references.append(formatted_id)
+        # The context manager closes the document even if extraction fails part way
+        with fitz.open(pdf_path) as doc:
+            for page_num, page in enumerate(doc):
+                # Interpret the page once; the TextPage serves every later extraction or search
+                textpage = page.get_textpage(flags=_TEXT_FLAGS)
+                full_text = textpage.extractText()
                 
-            logger.debug(f"Two-digit numbers found: {sorted([int(x) for x in two_digit_matches])}")
-            logger.debug(f"Filtered map references: {sorted(found_numbers)}")
-        
-        doc.close()
+                # Debug output is built only when DEBUG logging is enabled
+                debug = logger.isEnabledFor(logging.DEBUG)
+                if debug:
+                    logger.debug("Extracted text from %s, page %d: %r", pdf_path.name, page_num, full_text[:500])
+                    
+                    # Also log all unique short text pieces for debugging
+                    short_texts = _SHORT_TOK_RE.findall(full_text)
+                    logger.debug("All short text pieces (1-4 chars): %s", sorted(set(short_texts)))
+                
+                # Look for potential map reference patterns
+                # Based on visual inspection, we expect 2-digit numbers like 02, 03, 04
+                
+                # Locate full format references for this community by glyph position, then read
+                # just the text around each hit; the search runs in MuPDF against the same TextPage.
+                # Widen the hit in every direction, since references are often labelled vertically
+                for rect in page.search_for(f"{community_prefix}-", textpage=textpage):
+                    d = max(rect.width, rect.height)
+                    nearby = page.get_textbox(rect + (-d, -d, d, d), textpage=textpage)
+                    references.update(ref for ref in _FULL_REF_RE.findall(nearby) if ref.startswith(community_prefix + "-"))
+                
+                # Full format matches were handled by the search above; 2-digit numbers could be map references
+                # We need to be careful to distinguish between map references and lot numbers
+                two_digit_matches = [m.group('short') for m in _REF_RE.finditer(full_text) if m.group('short')]
+                found_numbers = _VALID_TWO_DIGIT & set(two_digit_matches)
+                
+                # Convert found numbers to proper format for this community
+                references.update(f"{community_prefix}-{num}" for num in found_numbers)
+                    
+                if debug:
+                    logger.debug("Two-digit numbers found: %s", sorted(int(x) for x in two_digit_matches))
+                    logger.debug("Filtered map references: %s", sorted(found_numbers))
         
-        # Remove duplicates, exclude the current map, and sort
-        current_map = pdf_path.stem  # Get filename without extension
-        references = list(set(references))
-        references = [ref for ref in references if ref != current_map]
-        references.sort()
+        # Exclude the current map
+        references.discard(current_map)
         
-        logger.info(f"Found {len(references)} potential references in {pdf_path.name}: {references}")
+        logger.info("Found %d potential references in %s: %s", len(references), pdf_path.name, sorted(references))
         
         # If we found very few or no references, let's try some adjacent numbers as fallback
         if len(references) < 3:
-            logger.warning(f"Found fewer than 3 references in {pdf_path.name}, using adjacent number fallback")
+            logger.warning("Found fewer than 3 references in %s, using adjacent number fallback", pdf_path.name)
             # Extract the number from current map (e.g., "001-01" -> 1)
-            if current_map.startswith("001-"):
-                try:
-                    current_num = int(current_map.split("-")[1])
-                    # Add likely adjacent maps
-                    fallback_refs = []
-                    for offset in [-1, 1, 10, -10]:  # Try adjacent and nearby maps
-                        adjacent_num = current_num + offset
-                        if 1 <= adjacent_num <= 99:
-                            fallback_refs.append(f"001-{adjacent_num:02d}")
-                    
-                    references.extend(fallback_refs)
-                    references = list(set(references))  # Remove duplicates
-                    references.sort()
-                    logger.info(f"Added fallback references: {fallback_refs}")
-                except ValueError:
-                    pass
+            try:
+                current_num = int(current_map.split("-")[1])
+                # Add likely adjacent maps
+                fallback_refs = []
+                for offset in [-1, 1, 10, -10]:  # Try adjacent and nearby maps
+                    adjacent_num = current_num + offset
+                    if 1 <= adjacent_num <= 99:
+                        fallback_refs.append(f"{community_prefix}-{adjacent_num:02d}")
+                
+                references.update(fallback_refs)
+                logger.info("Added fallback references: %s", fallback_refs)
+            except (IndexError, ValueError):
+                pass
         
     except Exception as e:
-        logger.error(f"Failed to extract references from {pdf_path}: {e}")
+        logger.error("Failed to extract references from %s: %s", pdf_path, e)
+    
+    return sorted(references)
+
+
+@functools.lru_cache(maxsize=128)
+def _extract_cached(pool: Executor, path_str: str, mtime_ns: int) -> asyncio.Future:
+    """
+    Start the extraction for one version of a PDF, or return the one already started.
+    
+    The result is cached as a future, so later phases and concurrent callers share a single
+    extraction. Keying on mtime_ns means a re-downloaded PDF is parsed again.
+    """
+    loop = asyncio.get_running_loop()
+    return loop.run_in_executor(pool, extract_map_references, Path(path_str))
+
+
+async def extract_references_async(pool: Executor, pdf_path: Path) -> List[str]:
+    """
+    Run extract_map_references in a worker process so the event loop keeps downloading.
+    
+    Args:
+        pool: Executor that runs the extraction
+        pdf_path: Path to the PDF file
     
-    return references
+    Returns:
+        List of map IDs found in the PDF
+    """
+    return await _extract_cached(pool, str(pdf_path), pdf_path.stat().st_mtime_ns)
 
 
-def crawl_all_communities(output_dir: Path) -> None:
+async def crawl_all_communities(output_dir: Path, session: aiohttp.ClientSession,
+                                throttle: RequestThrottle, sem: asyncio.Semaphore,
+                                pool: Executor) -> tuple[int, int]:
     """
-    Crawl all known communities in Esmeralda County.
+    Crawl all known communities in Esmeralda County concurrently.
+    
+    Communities share no state, so they run side by side; the shared throttle keeps the
+    combined request rate to the server at REQUESTS_PER_SECOND. A community that raises
+    is logged and skipped without cancelling the others.
     
     Args:
         output_dir: Directory to save PDFs
+        session: Shared HTTP session
+        throttle: Rate limiter shared by every request to the server
+        sem: Semaphore limiting the number of requests in flight
+        pool: Executor for PDF reference extraction
+    
+    Returns:
+        Tuple of (processed_count, failed_count) summed across communities
     """
     logger.info("Starting multi-community crawl for Esmeralda County")
     
+    results = await asyncio.gather(
+        *(hybrid_crawl_community_async(starting_map, output_dir, session, throttle, sem, pool) for starting_map in STARTING_MAPS),
+        return_exceptions=True
+    )
+    
     total_processed = 0
     total_failed = 0
     
-    for starting_map in STARTING_MAPS:
+    for starting_map, result in zip(STARTING_MAPS, results):
         community_prefix = starting_map.split("-")[0]
-        logger.info(f"Starting crawl for community {community_prefix} from map: {starting_map}")
+        if isinstance(result, BaseException):
+            logger.error(f"Crawl for community {community_prefix} aborted: {result!r}")
+            continue
         
-        processed, failed = hybrid_crawl_community(starting_map, output_dir)
+        processed, failed = result
         total_processed += processed
         total_failed += failed
         
@@ -243,26 +539,55 @@ def crawl_all_communities(output_dir: Path) -> None:
     return total_processed, total_failed
 
 
-def crawl_plat_maps(starting_map: str, output_dir: Path) -> tuple[int, int]:
+async def crawl_plat_maps_async(starting_map: str, output_dir: Path, session: aiohttp.ClientSession,
+                                throttle: RequestThrottle, sem: asyncio.Semaphore,
+                                pool: Executor) -> tuple[int, int]:
     """
     Main crawling function that downloads maps and follows references for a single community.
     
+    Reference extraction runs in the executor, so the next queued map downloads
+    while the previous PDF is still being parsed.
+    
     Args:
         starting_map: The map ID to start with
         output_dir: Directory to save PDFs
+        session: Shared HTTP session
+        throttle: Rate limiter shared by every request to the server
+        sem: Semaphore limiting the number of requests in flight
+        pool: Executor for PDF reference extraction
     
     Returns:
         Tuple of (processed_count, failed_count)
     """
     queue = deque([starting_map])
+    queued: Set[str] = {starting_map}  # Mirrors queue for O(1) membership tests
     processed: Set[str] = set()
     failed: Set[str] = set()
+    extractions = deque()  # Pending reference extractions, oldest first
     
     community_prefix = starting_map.split("-")[0]
     logger.info(f"Starting crawl for community {community_prefix} from map: {starting_map}")
     
-    while queue:
+    def queue_references(references: List[str]) -> None:
+        """Add new references to the queue (only for the same community)."""
+        for ref in references:
+            if ref.startswith(community_prefix + "-") and ref not in processed and ref not in failed and ref not in queued:
+                queue.append(ref)
+                queued.add(ref)
+                logger.info(f"Added {ref} to download queue")
+        
+        logger.info(f"Queue size: {len(queue)}, Processed: {len(processed)}, Failed: {len(failed)}")
+    
+    while queue or extractions:
+        # Collect finished extractions; block on the oldest only when there is nothing left to download
+        while extractions and (extractions[0].done() or not queue):
+            queue_references(await extractions.popleft())
+        
+        if not queue:
+            continue
+        
         current_map = queue.popleft()
+        queued.discard(current_map)
         
         # Skip if already processed
         if current_map in processed:
@@ -275,7 +600,7 @@ def crawl_plat_maps(starting_map: str, output_dir: Path) -> tuple[int, int]:
         logger.info(f"Processing map: {current_map} ({len(processed)} completed, {len(queue)} in queue)")
         
         # Download the PDF
-        success = download_pdf(current_map, output_dir)
+        success = await download_pdf_async(session, throttle, sem, current_map, output_dir)
         
         if not success:
             failed.add(current_map)
@@ -283,20 +608,9 @@ def crawl_plat_maps(starting_map: str, output_dir: Path) -> tuple[int, int]:
             
         processed.add(current_map)
         
-        # Wait to be respectful to the server
-        time.sleep(DELAY_SECONDS)
-        
-        # Extract references from the downloaded PDF
+        # Extract references from the downloaded PDF while the next one downloads
         pdf_path = output_dir / f"{current_map}.pdf"
-        references = extract_map_references(pdf_path)
-        
-        # Add new references to the queue (only for the same community)
-        for ref in references:
-            if ref.startswith(community_prefix + "-") and ref not in processed and ref not in failed and ref not in queue:
-                queue.append(ref)
-                logger.info(f"Added {ref} to download queue")
-        
-        logger.info(f"Queue size: {len(queue)}, Processed: {len(processed)}, Failed: {len(failed)}")
+        extractions.append(asyncio.ensure_future(extract_references_async(pool, pdf_path)))
     
     logger.info(f"Community {community_prefix} crawl complete! Downloaded {len(processed)} maps, {len(failed)} failed")
     
@@ -306,13 +620,18 @@ def crawl_plat_maps(starting_map: str, output_dir: Path) -> tuple[int, int]:
     return len(processed), len(failed)
 
 
-def systematic_discovery(community_prefix: str, output_dir: Path, max_attempts: int = 100) -> Set[str]:
+async def systematic_discovery_async(community_prefix: str, output_dir: Path, session: aiohttp.ClientSession,
+                                     throttle: RequestThrottle, sem: asyncio.Semaphore,
+                                     max_attempts: int = 100) -> Set[str]:
     """
     Systematically try sequential map numbers for a community to discover all available maps.
     
     Args:
         community_prefix: The community prefix (e.g., "001", "002", etc.)
         output_dir: Directory to save PDFs
+        session: Shared HTTP session
+        throttle: Rate limiter shared by every request to the server
+        sem: Semaphore limiting the number of requests in flight
         max_attempts: Maximum number of sequential attempts to try
     
     Returns:
@@ -321,49 +640,74 @@ def systematic_discovery(community_prefix: str, output_dir: Path, max_attempts:
     discovered = set()
     consecutive_failures = 0
     max_consecutive_failures = 10  # Stop after 10 consecutive failures
+    stop = False
+    existing = list_existing_pdfs(output_dir)
     
     logger.info(f"Starting systematic discovery for community {community_prefix}")
     
-    for i in range(1, max_attempts + 1):
-        map_id = f"{community_prefix}-{i:02d}"
+    for batch_start in range(1, max_attempts + 1, DISCOVERY_BATCH_SIZE):
+        batch = [f"{community_prefix}-{i:02d}"
+                 for i in range(batch_start, min(batch_start + DISCOVERY_BATCH_SIZE, max_attempts + 1))]
         
-        # Skip if already processed
-        if (output_dir / f"{map_id}.pdf").exists():
-            logger.debug(f"Skipping {map_id} - already exists")
-            discovered.add(map_id)
-            consecutive_failures = 0
-            continue
+        # Probe every missing map in the batch at once; the probes are independent
+        to_probe = [map_id for map_id in batch if f"{map_id}.pdf" not in existing]
+        logger.info(f"Trying systematic discovery: {', '.join(to_probe) or 'nothing to probe'}")
+        results = await asyncio.gather(
+            *(probe_exists_async(session, throttle, sem, map_id) for map_id in to_probe)
+        )
+        probed = dict(zip(to_probe, results))
         
-        logger.info(f"Trying systematic discovery: {map_id}")
-        success = download_pdf(map_id, output_dir)
+        # Walk the results in order so the consecutive failure count matches a sequential scan
+        hits = []
+        for map_id in batch:
+            # Skip if already processed
+            if map_id not in probed:
+                logger.debug(f"Skipping {map_id} - already exists")
+                discovered.add(map_id)
+                consecutive_failures = 0
+            elif probed[map_id]:
+                hits.append(map_id)
+                consecutive_failures = 0
+            else:
+                consecutive_failures += 1
+                logger.debug(f"✗ {map_id} not found ({consecutive_failures} consecutive failures)")
+                
+                # Stop if we've had too many consecutive failures; later hits in this batch are discarded
+                if consecutive_failures >= max_consecutive_failures:
+                    logger.info(f"Stopping systematic discovery for {community_prefix} after {consecutive_failures} consecutive failures")
+                    stop = True
+                    break
         
-        if success:
-            discovered.add(map_id)
-            consecutive_failures = 0
-            logger.info(f"✓ Discovered {map_id} via systematic search")
-        else:
-            consecutive_failures += 1
-            logger.debug(f"✗ {map_id} not found ({consecutive_failures} consecutive failures)")
-            
-            # Stop if we've had too many consecutive failures
-            if consecutive_failures >= max_consecutive_failures:
-                logger.info(f"Stopping systematic discovery for {community_prefix} after {consecutive_failures} consecutive failures")
-                break
+        # Only download the maps the probes found
+        downloads = await asyncio.gather(
+            *(download_pdf_async(session, throttle, sem, map_id, output_dir) for map_id in hits)
+        )
+        for map_id, success in zip(hits, downloads):
+            if success:
+                discovered.add(map_id)
+                existing.add(f"{map_id}.pdf")
+                logger.info(f"✓ Discovered {map_id} via systematic search")
         
-        # Be respectful to the server
-        time.sleep(DELAY_SECONDS)
+        if stop:
+            break
     
     logger.info(f"Systematic discovery for {community_prefix} complete: found {len(discovered)} maps")
     return discovered
 
 
-def hybrid_crawl_community(starting_map: str, output_dir: Path) -> tuple[int, int]:
+async def hybrid_crawl_community_async(starting_map: str, output_dir: Path, session: aiohttp.ClientSession,
+                                       throttle: RequestThrottle, sem: asyncio.Semaphore,
+                                       pool: Executor) -> tuple[int, int]:
     """
     Hybrid approach: First try PDF-based crawling, then systematic discovery.
     
     Args:
         starting_map: The map ID to start with
         output_dir: Directory to save PDFs
+        session: Shared HTTP session
+        throttle: Rate limiter shared by every request to the server
+        sem: Semaphore limiting the number of requests in flight
+        pool: Executor for PDF reference extraction
     
     Returns:
         Tuple of (processed_count, failed_count)
@@ -373,36 +717,35 @@ def hybrid_crawl_community(starting_map: str, output_dir: Path) -> tuple[int, in
     
     # Phase 1: PDF-based crawling (existing method)
     logger.info(f"Phase 1: PDF-based crawling for {community_prefix}")
-    processed_pdf, failed_pdf = crawl_plat_maps(starting_map, output_dir)
+    processed_pdf, failed_pdf = await crawl_plat_maps_async(starting_map, output_dir, session, throttle, sem, pool)
     
     # Phase 2: Systematic discovery
     logger.info(f"Phase 2: Systematic discovery for {community_prefix}")
-    discovered_systematic = systematic_discovery(community_prefix, output_dir)
+    discovered_systematic = await systematic_discovery_async(community_prefix, output_dir, session, throttle, sem)
     
     # Phase 3: Try to extract references from newly discovered maps
     logger.info(f"Phase 3: Processing newly discovered maps for {community_prefix}")
-    newly_discovered = []
-    for map_id in discovered_systematic:
-        pdf_path = output_dir / f"{map_id}.pdf"
-        if pdf_path.exists():
-            references = extract_map_references(pdf_path)
-            for ref in references:
-                if ref.startswith(community_prefix + "-") and not (output_dir / f"{ref}.pdf").exists():
-                    newly_discovered.append(ref)
+    newly_discovered = set()
+    existing = list_existing_pdfs(output_dir)
+    pdf_paths = [output_dir / f"{map_id}.pdf" for map_id in discovered_systematic if f"{map_id}.pdf" in existing]
+    results = await asyncio.gather(*(extract_references_async(pool, pdf_path) for pdf_path in pdf_paths))
+    for references in results:
+        for ref in references:
+            if ref.startswith(community_prefix + "-") and f"{ref}.pdf" not in existing:
+                newly_discovered.add(ref)
     
     # Phase 4: Download any additional references found
     logger.info(f"Phase 4: Downloading additional references for {community_prefix}")
     additional_processed = 0
     additional_failed = 0
     
-    for ref in newly_discovered:
+    for ref in sorted(newly_discovered):
         logger.info(f"Downloading additional reference: {ref}")
-        success = download_pdf(ref, output_dir)
+        success = await download_pdf_async(session, throttle, sem, ref, output_dir)
         if success:
             additional_processed += 1
         else:
             additional_failed += 1
-        time.sleep(DELAY_SECONDS)
     
     total_processed = processed_pdf + len(discovered_systematic) + additional_processed
     total_failed = failed_pdf + additional_failed
@@ -414,77 +757,36 @@ def hybrid_crawl_community(starting_map: str, output_dir: Path) -> tuple[int, in
     logger.info(f"  Total: {total_processed} maps, {total_failed} failed")
     
     return total_processed, total_failed
-    """
-    Main crawling function that downloads maps and follows references for a single community.
-    
-    Args:
-        starting_map: The map ID to start with
-        output_dir: Directory to save PDFs
-    
-    Returns:
-        Tuple of (processed_count, failed_count)
-    """
-    queue = deque([starting_map])
-    processed: Set[str] = set()
-    failed: Set[str] = set()
-    
-    community_prefix = starting_map.split("-")[0]
-    logger.info(f"Starting crawl for community {community_prefix} from map: {starting_map}")
-    
-    while queue:
-        current_map = queue.popleft()
-        
-        # Skip if already processed
-        if current_map in processed:
-            continue
-            
-        # Skip if previously failed
-        if current_map in failed:
-            continue
-        
-        logger.info(f"Processing map: {current_map} ({len(processed)} completed, {len(queue)} in queue)")
-        
-        # Download the PDF
-        success = download_pdf(current_map, output_dir)
-        
-        if not success:
-            failed.add(current_map)
-            continue
-            
-        processed.add(current_map)
-        
-        # Wait to be respectful to the server
-        time.sleep(DELAY_SECONDS)
-        
-        # Extract references from the downloaded PDF
-        pdf_path = output_dir / f"{current_map}.pdf"
-        references = extract_map_references(pdf_path)
-        
-        # Add new references to the queue (only for the same community)
-        for ref in references:
-            if ref.startswith(community_prefix + "-") and ref not in processed and ref not in failed and ref not in queue:
-                queue.append(ref)
-                logger.info(f"Added {ref} to download queue")
-        
-        logger.info(f"Queue size: {len(queue)}, Processed: {len(processed)}, Failed: {len(failed)}")
-    
-    logger.info(f"Community {community_prefix} crawl complete! Downloaded {len(processed)} maps, {len(failed)} failed")
-    
-    if failed:
-        logger.warning(f"Failed to download from community {community_prefix}: {sorted(failed)}")
-    
-    return len(processed), len(failed)
 
 
-def main():
+async def main():
     """Main entry point."""
     logger.info("Starting Esmeralda County Multi-Community Plat Map Retrieval")
     
     # Setup
     output_dir = setup_output_directory(OUTPUT_DIR)
+    load_crawl_state(output_dir)
+    atexit.register(save_crawl_state, output_dir)
+    # Pool size matches the semaphore, so a request holding the semaphore never queues for a connection
+    connector = aiohttp.TCPConnector(limit=MAX_CONCURRENT_REQUESTS, limit_per_host=MAX_CONCURRENT_REQUESTS,
+                                     keepalive_timeout=KEEPALIVE_SECONDS)
+    # No overall deadline: a large PDF on a slow link may take longer than any single read
+    timeout = aiohttp.ClientTimeout(total=None, sock_connect=REQUEST_TIMEOUT_SECONDS,
+                                    sock_read=REQUEST_TIMEOUT_SECONDS)
+    # PDFs are already compressed, so skip gzip negotiation
+    headers = {"Accept-Encoding": "identity"}
+    throttle = RequestThrottle(REQUESTS_PER_SECOND)
+    # Shared by every community crawl to stay polite to the county server; created here so it
+    # binds to the event loop asyncio.run() starts (Python 3.9 binds at construction)
+    sem = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
     
     # Start crawling all communities
-    total_processed, total_failed = crawl_all_communities(output_dir)
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout, headers=headers) as session:
+            total_processed, total_failed = await crawl_all_communities(output_dir, session, throttle, sem, pool)
+    
+    # Cached futures belong to this event loop and pool
+    _extract_cached.cache_clear()
     
     # Summary
     pdf_files = list(output_dir.glob("*.pdf"))
@@ -510,4 +812,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())